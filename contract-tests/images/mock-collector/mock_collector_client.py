@@ -1,9 +1,9 @@
 # Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
 # SPDX-License-Identifier: Apache-2.0
-from datetime import datetime, timedelta
+from itertools import cycle
 from logging import Logger, getLogger
-from time import sleep
-from typing import Callable, List, Set, TypeVar
+from time import monotonic
+from typing import AbstractSet, Callable, Iterator, List, Set, Tuple, TypeVar
 
 from google.protobuf.internal.containers import RepeatedScalarFieldContainer
 from grpc import Channel, insecure_channel
@@ -15,6 +15,8 @@ from mock_collector_service_pb2 import (
     GetMetricsResponse,
     GetTracesRequest,
     GetTracesResponse,
+    WaitForMetricsRequest,
+    WaitForTracesRequest,
 )
 from mock_collector_service_pb2_grpc import MockCollectorServiceStub
 
@@ -26,8 +28,19 @@ from opentelemetry.proto.metrics.v1.metrics_pb2 import Metric, ResourceMetrics,
 from opentelemetry.proto.trace.v1.trace_pb2 import ResourceSpans, ScopeSpans, Span
 
 _logger: Logger = getLogger(__name__)
-_TIMEOUT_DELAY: timedelta = timedelta(seconds=20)
-_WAIT_INTERVAL_SEC: float = 0.1
+_TIMEOUT_DELAY_SEC: float = 20
+# Each channel gets its own connection, so concurrent calls are not serialized behind one HTTP/2 connection's flow
+# control and head-of-line blocking.
+_CHANNEL_POOL_SIZE: int = 4
+# Matches the collector's send limit: get_* responses carrying the whole backlog can exceed the 4 MiB default.
+_GRPC_MAX_RECEIVE_MESSAGE_LENGTH: int = 64 * 1024 * 1024
+_CHANNEL_OPTIONS: List[Tuple[str, int]] = [
+    # A local subchannel pool stops gRPC from sharing one connection between channels to the same target.
+    ("grpc.use_local_subchannel_pool", 1),
+    ("grpc.max_receive_message_length", _GRPC_MAX_RECEIVE_MESSAGE_LENGTH),
+]
+# How long the collector must stay quiet before the exported content is considered complete.
+_WAIT_INTERVAL_MILLIS: int = 100
 T: TypeVar = TypeVar("T")
 
 
@@ -37,6 +50,8 @@ class ResourceScopeSpan:
     Correlate resource, scope and span
     """
 
+    __slots__ = ("resource_spans", "scope_spans", "span")
+
     def __init__(self, resource_spans: ResourceSpans, scope_spans: ScopeSpans, span: Span):
         self.resource_spans: ResourceSpans = resource_spans
         self.scope_spans: ScopeSpans = scope_spans
@@ -49,6 +64,8 @@ class ResourceScopeMetric:
     Correlate resource, scope and metric
     """
 
+    __slots__ = ("resource_metrics", "scope_metrics", "metric")
+
     def __init__(self, resource_metrics: ResourceMetrics, scope_metrics: ScopeMetrics, metric: Metric):
         self.resource_metrics: ResourceMetrics = resource_metrics
         self.scope_metrics: ScopeMetrics = scope_metrics
@@ -58,6 +75,8 @@ class ResourceScopeMetric:
 class ResourceScopeLog:
     """Correlate resource, scope and log record."""
 
+    __slots__ = ("resource_logs", "scope_logs", "log_record")
+
     def __init__(self, resource_logs: ResourceLogs, scope_logs: ScopeLogs, log_record: OtlpLogRecord):
         self.resource_logs: ResourceLogs = resource_logs
         self.scope_logs: ScopeLogs = scope_logs
@@ -68,39 +87,74 @@ class MockCollectorClient:
     """The mock collector client is used to interact with the Mock collector image, used in the tests."""
 
     def __init__(self, mock_collector_address: str, mock_collector_port: str):
-        channel: Channel = insecure_channel(f"{mock_collector_address}:{mock_collector_port}")
-        self.client: MockCollectorServiceStub = MockCollectorServiceStub(channel)
+        channels: List[Channel] = [
+            insecure_channel(f"{mock_collector_address}:{mock_collector_port}", options=_CHANNEL_OPTIONS)
+            for _ in range(_CHANNEL_POOL_SIZE)
+        ]
+        self._stubs: Iterator[MockCollectorServiceStub] = cycle([MockCollectorServiceStub(c) for c in channels])
+
+    @property
+    def client(self) -> MockCollectorServiceStub:
+        """Stub for the next channel in the pool, picked round-robin."""
+        return next(self._stubs)
 
     def clear_signals(self) -> None:
         """Clear all the signals in the backend collector"""
         self.client.clear(ClearRequest())
 
-    def get_traces(self) -> List[ResourceScopeSpan]:
+    def get_traces(self, min_server_spans: int = 0) -> List[ResourceScopeSpan]:
         """Get all traces that are currently stored in the collector
 
+        Args:
+            min_server_spans: keep waiting until at least this many server spans have been received.
+
         Returns:
             List of `ResourceScopeSpan` which is essentially a flat list containing all the spans and their related
             scope and resources.
         """
 
+        # Only traces exported since the previous poll are fetched and parsed; earlier ones are kept here.
+        parsed_traces: List[ExportTraceServiceRequest] = []
+        last_seq: int = 0
+
         def get_export() -> List[ExportTraceServiceRequest]:
-            response: GetTracesResponse = self.client.get_traces(GetTracesRequest())
+            nonlocal last_seq
+            response: GetTracesResponse = self.client.get_traces(GetTracesRequest(after_seq=last_seq))
             serialized_traces: RepeatedScalarFieldContainer[bytes] = response.traces
-            return list(map(ExportTraceServiceRequest.FromString, serialized_traces))
+            parsed_traces.extend(map(ExportTraceServiceRequest.FromString, serialized_traces))
+            last_seq = response.last_seq
+            return list(parsed_traces)
 
         def wait_condition(exported: List[ExportTraceServiceRequest], current: List[ExportTraceServiceRequest]) -> bool:
-            return 0 < len(exported) == len(current)
-
-        exported_traces: List[ExportTraceServiceRequest] = _wait_for_content(get_export, wait_condition)
-        spans: List[ResourceScopeSpan] = []
-        for exported_trace in exported_traces:
-            for resource_span in exported_trace.resource_spans:
-                for scope_span in resource_span.scope_spans:
-                    for span in scope_span.spans:
-                        spans.append(ResourceScopeSpan(resource_span, scope_span, span))
-        return spans
-
-    def get_metrics(self, present_metrics: Set[str]) -> List[ResourceScopeMetric]:
+            if not 0 < len(exported) == len(current):
+                return False
+            if min_server_spans <= 0:
+                return True
+            server_spans: int = sum(
+                1
+                for exported_trace in current
+                for resource_span in exported_trace.resource_spans
+                for scope_span in resource_span.scope_spans
+                for span in scope_span.spans
+                if span.kind == Span.SPAN_KIND_SERVER  # pylint: disable=no-member
+            )
+            return server_spans >= min_server_spans
+
+        def wait_for_change(count: int) -> None:
+            self.client.wait_for_traces(WaitForTracesRequest(count=count, timeout_millis=_WAIT_INTERVAL_MILLIS))
+
+        exported_traces: List[ExportTraceServiceRequest] = _wait_for_content(
+            get_export, wait_for_change, wait_condition
+        )
+        return [
+            ResourceScopeSpan(resource_span, scope_span, span)
+            for exported_trace in exported_traces
+            for resource_span in exported_trace.resource_spans
+            for scope_span in resource_span.scope_spans
+            for span in scope_span.spans
+        ]
+
+    def get_metrics(self, present_metrics: AbstractSet[str]) -> List[ResourceScopeMetric]:
         """Get all metrics that are currently stored in the mock collector.
 
         Returns:
@@ -110,58 +164,97 @@ class MockCollectorClient:
 
         present_metrics_lower: Set[str] = {s.lower() for s in present_metrics}
 
+        # Only metrics exported since the previous poll are fetched and parsed; earlier ones are kept here.
+        parsed_metrics: List[ExportMetricsServiceRequest] = []
+        last_seq: int = 0
+
         def get_export() -> List[ExportMetricsServiceRequest]:
-            response: GetMetricsResponse = self.client.get_metrics(GetMetricsRequest())
+            nonlocal last_seq
+            response: GetMetricsResponse = self.client.get_metrics(GetMetricsRequest(after_seq=last_seq))
             serialized_metrics: RepeatedScalarFieldContainer[bytes] = response.metrics
-            return list(map(ExportMetricsServiceRequest.FromString, serialized_metrics))
+            parsed_metrics.extend(map(ExportMetricsServiceRequest.FromString, serialized_metrics))
+            last_seq = response.last_seq
+            return list(parsed_metrics)
 
         def wait_condition(
             exported: List[ExportMetricsServiceRequest], current: List[ExportMetricsServiceRequest]
         ) -> bool:
-            received_metrics: Set[str] = set()
-            for exported_metric in current:
-                for resource_metric in exported_metric.resource_metrics:
-                    for scope_metric in resource_metric.scope_metrics:
-                        for metric in scope_metric.metrics:
-                            received_metrics.add(metric.name.lower())
-            return 0 < len(exported) == len(current) and present_metrics_lower.issubset(received_metrics)
-
-        exported_metrics: List[ExportMetricsServiceRequest] = _wait_for_content(get_export, wait_condition)
-        metrics: List[ResourceScopeMetric] = []
-        for exported_metric in exported_metrics:
-            for resource_metric in exported_metric.resource_metrics:
-                for scope_metric in resource_metric.scope_metrics:
-                    for metric in scope_metric.metrics:
-                        metrics.append(ResourceScopeMetric(resource_metric, scope_metric, metric))
-        return metrics
+            # Until the export count settles the answer is False anyway, so skip walking the metric tree.
+            if not 0 < len(exported) == len(current):
+                return False
+            received_metrics: Set[str] = {
+                metric.name
+                for exported_metric in current
+                for resource_metric in exported_metric.resource_metrics
+                for scope_metric in resource_metric.scope_metrics
+                for metric in scope_metric.metrics
+            }
+            # The same few metric names repeat across exports, so lower-case each distinct name once.
+            received_metrics_lower: Set[str] = {name.lower() for name in received_metrics}
+            return present_metrics_lower.issubset(received_metrics_lower)
+
+        def wait_for_change(count: int) -> None:
+            self.client.wait_for_metrics(WaitForMetricsRequest(count=count, timeout_millis=_WAIT_INTERVAL_MILLIS))
+
+        exported_metrics: List[ExportMetricsServiceRequest] = _wait_for_content(
+            get_export, wait_for_change, wait_condition
+        )
+        return [
+            ResourceScopeMetric(resource_metric, scope_metric, metric)
+            for exported_metric in exported_metrics
+            for resource_metric in exported_metric.resource_metrics
+            for scope_metric in resource_metric.scope_metrics
+            for metric in scope_metric.metrics
+        ]
+
+    def wait_for_metric_exports(self, count: int, timeout_sec: float) -> int:
+        """Block until the collector holds at least count metric exports, or timeout_sec has elapsed.
+
+        Returns the number of metric exports held when the wait ended.
+        """
+        deadline: float = monotonic() + timeout_sec
+        stored: int = 0
+        while stored < count:
+            remaining_millis: int = int((deadline - monotonic()) * 1000)
+            if remaining_millis <= 0:
+                break
+            # Returns as soon as the stored count differs from the last one seen, so every export is counted once.
+            request: WaitForMetricsRequest = WaitForMetricsRequest(count=stored, timeout_millis=remaining_millis)
+            stored = self.client.wait_for_metrics(request).count
+        return stored
 
     def get_logs_now(self) -> List[ResourceScopeLog]:
         """Non-blocking snapshot of all LogRecords currently stored in the mock collector."""
         response: GetLogsResponse = self.client.get_logs(GetLogsRequest())
         serialized: RepeatedScalarFieldContainer[bytes] = response.logs
         exported: List[ExportLogsServiceRequest] = list(map(ExportLogsServiceRequest.FromString, serialized))
-        result: List[ResourceScopeLog] = []
-        for export in exported:
-            for rlog in export.resource_logs:
-                for slog in rlog.scope_logs:
-                    for rec in slog.log_records:
-                        result.append(ResourceScopeLog(rlog, slog, rec))
-        return result
-
-
-def _wait_for_content(get_export: Callable[[], List[T]], wait_condition: Callable[[List[T], List[T]], bool]) -> List[T]:
-    # Verify that there is no more data to be received
-    deadline: datetime = datetime.now() + _TIMEOUT_DELAY
+        return [
+            ResourceScopeLog(rlog, slog, rec)
+            for export in exported
+            for rlog in export.resource_logs
+            for slog in rlog.scope_logs
+            for rec in slog.log_records
+        ]
+
+
+def _wait_for_content(
+    get_export: Callable[[], List[T]],
+    wait_for_change: Callable[[int], None],
+    wait_condition: Callable[[List[T], List[T]], bool],
+) -> List[T]:
+    # Verify that there is no more data to be received. Rather than sleeping a fixed interval between reads, block in
+    # the collector until something new is exported (returning as soon as it is) or the quiet interval elapses.
+    deadline: float = monotonic() + _TIMEOUT_DELAY_SEC
     exported: List[T] = []
 
-    while deadline > datetime.now():
+    while deadline > monotonic():
         try:
             current_exported: List[T] = get_export()
             if wait_condition(exported, current_exported):
                 return current_exported
             exported = current_exported
 
-            sleep(_WAIT_INTERVAL_SEC)
+            wait_for_change(len(current_exported))
         # pylint: disable=broad-exception-caught
         except Exception:
             _logger.exception("Error while reading content")
@@ -0,0 +1,70 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+from asyncio import Condition, TimeoutError as AsyncioTimeoutError, wait_for
+from collections import deque
+from itertools import islice
+from typing import List, Tuple
+
+
+class ExportRequestStore:
+    """Stores the export requests received by one of the mock collector's OTLP services.
+
+    Requests are stored serialized, so get_* can hand them to the client without re-encoding on every poll. Each is
+    paired with a sequence number that keeps increasing across clears, so readers can ask for just the requests they have
+    not seen yet. All access happens on the server's event loop, so the store needs no lock.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._export_requests: deque = deque()
+        self._last_seq: int = 0
+
+    def get_requests(self, after_seq: int = 0) -> Tuple[List[bytes], int]:
+        """Return the serialized export requests stored after after_seq, and the sequence number of the last one."""
+        snapshot: List[Tuple[int, bytes]] = list(self._export_requests)
+        if not snapshot:
+            return [], after_seq
+        # Sequence numbers in the store are contiguous, so the first new request can be located without a search.
+        start: int = max(0, after_seq - snapshot[0][0] + 1)
+        # islice walks the snapshot in place rather than copying the tail before unpacking it.
+        return [request for _, request in islice(snapshot, start, None)], snapshot[-1][0]
+
+    # Coroutines so that the HTTP handler and MockCollectorService drive every store the same way, whether or not it
+    # can be waited on.
+    async def add_request(self, serialized_request: bytes) -> None:
+        self._last_seq += 1
+        self._export_requests.append((self._last_seq, serialized_request))
+
+    async def clear_requests(self) -> None:
+        self._export_requests.clear()
+
+
+class WaitableExportRequestStore(ExportRequestStore):
+    """An ExportRequestStore that callers can wait on until its contents change."""
+
+    def __init__(self):
+        super().__init__()
+        # Writers only take the condition to wake up callers awaiting wait_for_change.
+        self._changed: Condition = Condition()
+
+    async def add_request(self, serialized_request: bytes) -> None:
+        async with self._changed:
+            await super().add_request(serialized_request)
+            self._changed.notify_all()
+
+    async def clear_requests(self) -> None:
+        async with self._changed:
+            await super().clear_requests()
+            self._changed.notify_all()
+
+    async def wait_for_change(self, count: int, timeout_sec: float) -> int:
+        """Wait until the number of stored requests differs from count or the timeout elapses.
+
+        Returns the number of stored requests when the wait ended.
+        """
+        async with self._changed:
+            try:
+                await wait_for(self._changed.wait_for(lambda: len(self._export_requests) != count), timeout_sec)
+            except AsyncioTimeoutError:
+                pass
+            return len(self._export_requests)
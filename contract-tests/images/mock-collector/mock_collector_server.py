@@ -1,16 +1,16 @@
 # Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
 # SPDX-License-Identifier: Apache-2.0
-import atexit
+import asyncio
 import gzip
 import io
 import sys
 import threading
-from concurrent.futures import ThreadPoolExecutor
 from http.server import BaseHTTPRequestHandler
 
 from socketserver import ThreadingTCPServer
 
-from grpc import server
+from grpc import RpcMethodHandler, method_handlers_generic_handler, unary_unary_rpc_method_handler
+from grpc.aio import Server, server
 from mock_collector_logs_service import MockCollectorLogsService
 from mock_collector_metrics_service import MockCollectorMetricsService
 from mock_collector_service import MockCollectorService
@@ -19,18 +19,43 @@ from mock_collector_trace_service import MockCollectorTraceService
 
 from google.protobuf.json_format import Parse as proto_json_parse
 from opentelemetry.proto.collector.logs.v1.logs_service_pb2 import ExportLogsServiceRequest, ExportLogsServiceResponse
-from opentelemetry.proto.collector.logs.v1.logs_service_pb2_grpc import add_LogsServiceServicer_to_server
 from opentelemetry.proto.collector.metrics.v1.metrics_service_pb2 import (
     ExportMetricsServiceRequest,
     ExportMetricsServiceResponse,
 )
-from opentelemetry.proto.collector.metrics.v1.metrics_service_pb2_grpc import add_MetricsServiceServicer_to_server
-from opentelemetry.proto.collector.trace.v1.trace_service_pb2_grpc import add_TraceServiceServicer_to_server
+from opentelemetry.proto.collector.trace.v1.trace_service_pb2 import ExportTraceServiceResponse
 
 # Port for OTLP/gRPC (used by Application Signals)
 _GRPC_PORT = 4315
 # Port for OTLP/HTTP (used by DI snapshot emitter + ServiceEvents)
 _HTTP_PORT = 4318
+_GRPC_MAX_MESSAGE_LENGTH = 64 * 1024 * 1024
+_GRPC_SERVER_OPTIONS = [
+    # Batched exports and get_* responses carrying the whole backlog can exceed the 4 MiB default; MockCollectorClient
+    # raises its receive limit to match.
+    ("grpc.max_receive_message_length", _GRPC_MAX_MESSAGE_LENGTH),
+    ("grpc.max_send_message_length", _GRPC_MAX_MESSAGE_LENGTH),
+    ("grpc.max_concurrent_streams", 1000),
+    # Let idle exporter connections keep pinging without being sent GOAWAY.
+    ("grpc.http2.max_pings_without_data", 0),
+    # Grow HTTP/2 flow-control windows from measured bandwidth-delay so large exports are not window-bound.
+    ("grpc.http2.bdp_probe", 1),
+    # Stored signals live in this process, so a second collector must not be able to share the port: the kernel would
+    # spread exporters across both and each would only ever report part of the telemetry.
+    ("grpc.so_reuseport", 0),
+]
+
+
+def _add_export_servicer_to_server(service_name: str, servicer, response_cls, grpc_server: Server) -> None:
+    """Register servicer.Export for an OTLP service without a request deserializer.
+
+    The generated add_*Servicer_to_server helpers parse every request into a
+    protobuf message, but the collectors only store requests in serialized
+    form. Without a deserializer gRPC hands Export the raw request bytes."""
+    export_handler: RpcMethodHandler = unary_unary_rpc_method_handler(
+        servicer.Export, request_deserializer=None, response_serializer=response_cls.SerializeToString
+    )
+    grpc_server.add_generic_rpc_handlers((method_handlers_generic_handler(service_name, {"Export": export_handler}),))
 
 
 def _read_chunked(rfile):
@@ -53,18 +78,28 @@ def _read_chunked(rfile):
 
 
 def _make_http_handler(
+    loop: asyncio.AbstractEventLoop,
     logs_collector: MockCollectorLogsService,
     metrics_collector: MockCollectorMetricsService,
 ):
     """Create an HTTP request handler that routes OTLP HTTP logs and metrics
-    into the same queues used by the gRPC services.
+    into the same stores used by the gRPC services.
 
     Uses HTTP/1.1 with keep-alive and supports both Content-Length and
     Transfer-Encoding: chunked request bodies (Node.js defaults to
     chunked when Content-Length is not explicitly set).
 
     Supports both JSON (default for @opentelemetry/exporter-*-otlp-http)
-    and protobuf content types."""
+    and protobuf content types.
+
+    Requests are handled on the HTTP server's threads, but the collectors
+    belong to the gRPC server's event loop, so stores are handed to *loop*."""
+
+    # Path -> (request type, response type, collector storing the request).
+    routes = {
+        "/v1/logs": (ExportLogsServiceRequest, ExportLogsServiceResponse, logs_collector),
+        "/v1/metrics": (ExportMetricsServiceRequest, ExportMetricsServiceResponse, metrics_collector),
+    }
 
     class OtlpHttpHandler(BaseHTTPRequestHandler):
         # HTTP/1.1 is required so Node.js clients can reuse connections
@@ -82,7 +117,10 @@ def _make_http_handler(
                 return self.rfile.read(int(content_length))
             return b""
 
-        def _parse_and_store(self, request_cls, response_cls, queue):
+        def _store(self, collector, serialized_request):
+            asyncio.run_coroutine_threadsafe(collector.add_request(serialized_request), loop).result()
+
+        def _parse_and_store(self, request_cls, response_cls, collector):
             body = self._read_body()
             content_type = self.headers.get("Content-Type", "")
             # Decode is header-driven: OTLP payloads are usually uncompressed, but if a
@@ -95,9 +133,11 @@ def _make_http_handler(
                 if len(body) > 0:
                     if "application/json" in content_type:
                         proto_json_parse(body.decode("utf-8"), req)
+                        self._store(collector, req.SerializeToString())
                     else:
+                        # Parse only to reject malformed payloads; the body already is the wire form we store.
                         req.ParseFromString(body)
-                    queue.put(req)
+                        self._store(collector, body)
                 if "application/json" in content_type:
                     resp_bytes = b"{}"
                     resp_ct = "application/json"
@@ -116,18 +156,9 @@ def _make_http_handler(
                 self.end_headers()
 
         def do_POST(self):
-            if self.path == "/v1/logs":
-                self._parse_and_store(
-                    ExportLogsServiceRequest,
-                    ExportLogsServiceResponse,
-                    logs_collector._export_requests,
-                )
-            elif self.path == "/v1/metrics":
-                self._parse_and_store(
-                    ExportMetricsServiceRequest,
-                    ExportMetricsServiceResponse,
-                    metrics_collector._export_requests,
-                )
+            route = routes.get(self.path)
+            if route is not None:
+                self._parse_and_store(*route)
             else:
                 self.send_response(404)
                 self.send_header("Content-Length", "0")
@@ -146,8 +177,10 @@ class _ThreadingHTTPServer(ThreadingTCPServer):
     daemon_threads = True
 
 
-def main() -> None:
-    mock_collector_server: server = server(thread_pool=ThreadPoolExecutor(max_workers=10))
+async def serve() -> None:
+    # Every RPC is served on this event loop: Export only appends to a deque, so there is nothing to gain from handing
+    # each call to a worker thread.
+    mock_collector_server: Server = server(options=_GRPC_SERVER_OPTIONS)
     mock_collector_server.add_insecure_port(f"0.0.0.0:{_GRPC_PORT}")
 
     trace_collector: MockCollectorTraceService = MockCollectorTraceService()
@@ -155,27 +188,48 @@ def main() -> None:
     logs_collector: MockCollectorLogsService = MockCollectorLogsService()
     mock_collector: MockCollectorService = MockCollectorService(trace_collector, metrics_collector, logs_collector)
 
-    add_TraceServiceServicer_to_server(trace_collector, mock_collector_server)
-    add_MetricsServiceServicer_to_server(metrics_collector, mock_collector_server)
-    add_LogsServiceServicer_to_server(logs_collector, mock_collector_server)
+    _add_export_servicer_to_server(
+        "opentelemetry.proto.collector.trace.v1.TraceService",
+        trace_collector,
+        ExportTraceServiceResponse,
+        mock_collector_server,
+    )
+    _add_export_servicer_to_server(
+        "opentelemetry.proto.collector.metrics.v1.MetricsService",
+        metrics_collector,
+        ExportMetricsServiceResponse,
+        mock_collector_server,
+    )
+    _add_export_servicer_to_server(
+        "opentelemetry.proto.collector.logs.v1.LogsService",
+        logs_collector,
+        ExportLogsServiceResponse,
+        mock_collector_server,
+    )
     add_MockCollectorServiceServicer_to_server(mock_collector, mock_collector_server)
 
-    mock_collector_server.start()
-    atexit.register(mock_collector_server.stop, None)
+    await mock_collector_server.start()
 
     # Start OTLP/HTTP receiver on a separate port for clients using
     # @opentelemetry/exporter-{logs,metrics}-otlp-http (DI snapshot emitter +
-    # ServiceEvents). Routes /v1/logs and /v1/metrics into the same queues used
+    # ServiceEvents). Routes /v1/logs and /v1/metrics into the same stores used
     # by their gRPC counterparts.
     http_server = _ThreadingHTTPServer(
         ("0.0.0.0", _HTTP_PORT),
-        _make_http_handler(logs_collector, metrics_collector),
+        _make_http_handler(asyncio.get_running_loop(), logs_collector, metrics_collector),
     )
     http_thread = threading.Thread(target=http_server.serve_forever, daemon=True)
     http_thread.start()
 
     print("Ready")
-    mock_collector_server.wait_for_termination(None)
+    try:
+        await mock_collector_server.wait_for_termination()
+    finally:
+        await mock_collector_server.stop(None)
+
+
+def main() -> None:
+    asyncio.run(serve())
 
 
 if __name__ == "__main__":
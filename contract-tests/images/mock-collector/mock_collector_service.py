@@ -2,7 +2,7 @@
 # SPDX-License-Identifier: Apache-2.0
 from typing import List
 
-from grpc import ServicerContext
+from grpc.aio import ServicerContext
 from mock_collector_logs_service import MockCollectorLogsService
 from mock_collector_metrics_service import MockCollectorMetricsService
 from mock_collector_service_pb2 import (
@@ -14,18 +14,19 @@ from mock_collector_service_pb2 import (
     GetMetricsResponse,
     GetTracesRequest,
     GetTracesResponse,
+    WaitForMetricsRequest,
+    WaitForMetricsResponse,
+    WaitForTracesRequest,
+    WaitForTracesResponse,
 )
 from mock_collector_service_pb2_grpc import MockCollectorServiceServicer
 from mock_collector_trace_service import MockCollectorTraceService
 from typing_extensions import override
 
-from opentelemetry.proto.collector.logs.v1.logs_service_pb2 import ExportLogsServiceRequest
-from opentelemetry.proto.collector.metrics.v1.metrics_service_pb2 import ExportMetricsServiceRequest
-from opentelemetry.proto.collector.trace.v1.trace_service_pb2 import ExportTraceServiceRequest
-
 
 class MockCollectorService(MockCollectorServiceServicer):
-    """Implements clear, get_traces, get_metrics, and (via attribute) get_logs for the mock collector."""
+    """Implements clear, get_traces, get_metrics, wait_for_traces, wait_for_metrics, and (via attribute) get_logs for the
+    mock collector."""
 
     def __init__(
         self,
@@ -39,31 +40,34 @@ class MockCollectorService(MockCollectorServiceServicer):
         self.logs_collector: MockCollectorLogsService = logs_collector
 
     @override
-    def clear(self, request: ClearRequest, context: ServicerContext) -> ClearResponse:
-        self.trace_collector.clear_requests()
-        self.metrics_collector.clear_requests()
+    async def clear(self, request: ClearRequest, context: ServicerContext) -> ClearResponse:
+        await self.trace_collector.clear_requests()
+        await self.metrics_collector.clear_requests()
         if self.logs_collector is not None:
-            self.logs_collector.clear_requests()
+            await self.logs_collector.clear_requests()
         return ClearResponse()
 
     @override
-    def get_traces(self, request: GetTracesRequest, context: ServicerContext) -> GetTracesResponse:
-        trace_requests: List[ExportTraceServiceRequest] = self.trace_collector.get_requests()
-        traces: List[bytes] = list(map(ExportTraceServiceRequest.SerializeToString, trace_requests))
-        response: GetTracesResponse = GetTracesResponse(traces=traces)
-        return response
+    async def get_traces(self, request: GetTracesRequest, context: ServicerContext) -> GetTracesResponse:
+        traces, last_seq = self.trace_collector.get_requests(request.after_seq)
+        return GetTracesResponse(traces=traces, last_seq=last_seq)
 
     @override
-    def get_metrics(self, request: GetMetricsRequest, context: ServicerContext) -> GetMetricsResponse:
-        metric_requests: List[ExportMetricsServiceRequest] = self.metrics_collector.get_requests()
-        metrics: List[bytes] = list(map(ExportMetricsServiceRequest.SerializeToString, metric_requests))
-        response: GetMetricsResponse = GetMetricsResponse(metrics=metrics)
-        return response
+    async def get_metrics(self, request: GetMetricsRequest, context: ServicerContext) -> GetMetricsResponse:
+        metrics, last_seq = self.metrics_collector.get_requests(request.after_seq)
+        return GetMetricsResponse(metrics=metrics, last_seq=last_seq)
 
     @override
-    def get_logs(self, request: GetLogsRequest, context: ServicerContext) -> GetLogsResponse:
-        log_requests: List[ExportLogsServiceRequest] = (
-            self.logs_collector.get_requests() if self.logs_collector is not None else []
-        )
-        logs: List[bytes] = list(map(ExportLogsServiceRequest.SerializeToString, log_requests))
+    async def get_logs(self, request: GetLogsRequest, context: ServicerContext) -> GetLogsResponse:
+        logs: List[bytes] = self.logs_collector.get_requests()[0] if self.logs_collector is not None else []
         return GetLogsResponse(logs=logs)
+
+    @override
+    async def wait_for_traces(self, request: WaitForTracesRequest, context: ServicerContext) -> WaitForTracesResponse:
+        count: int = await self.trace_collector.wait_for_change(request.count, request.timeout_millis / 1000)
+        return WaitForTracesResponse(count=count)
+
+    @override
+    async def wait_for_metrics(self, request: WaitForMetricsRequest, context: ServicerContext) -> WaitForMetricsResponse:
+        count: int = await self.metrics_collector.wait_for_change(request.count, request.timeout_millis / 1000)
+        return WaitForMetricsResponse(count=count)
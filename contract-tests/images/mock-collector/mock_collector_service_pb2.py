@@ -24,7 +24,7 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x1cmock_collector_service.proto\"\x0e\n\x0c\x43learRequest\"\x0f\n\rClearResponse\"\x12\n\x10GetTracesRequest\"#\n\x11GetTracesResponse\x12\x0e\n\x06traces\x18\x01 \x03(\x0c\"\x13\n\x11GetMetricsRequest\"%\n\x12GetMetricsResponse\x12\x0f\n\x07metrics\x18\x01 \x03(\x0c\"\x10\n\x0eGetLogsRequest\"\x1f\n\x0fGetLogsResponse\x12\x0c\n\x04logs\x18\x01 \x03(\x0c\x32\xe2\x01\n\x14MockCollectorService\x12(\n\x05\x63lear\x12\r.ClearRequest\x1a\x0e.ClearResponse\"\x00\x12\x35\n\nget_traces\x12\x11.GetTracesRequest\x1a\x12.GetTracesResponse\"\x00\x12\x38\n\x0bget_metrics\x12\x12.GetMetricsRequest\x1a\x13.GetMetricsResponse\"\x00\x12/\n\x08get_logs\x12\x0f.GetLogsRequest\x1a\x10.GetLogsResponse\"\x00\x62\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x1cmock_collector_service.proto\"\x0e\n\x0c\x43learRequest\"\x0f\n\rClearResponse\"%\n\x10GetTracesRequest\x12\x11\n\tafter_seq\x18\x01 \x01(\x04\"5\n\x11GetTracesResponse\x12\x0e\n\x06traces\x18\x01 \x03(\x0c\x12\x10\n\x08last_seq\x18\x02 \x01(\x04\"&\n\x11GetMetricsRequest\x12\x11\n\tafter_seq\x18\x01 \x01(\x04\"7\n\x12GetMetricsResponse\x12\x0f\n\x07metrics\x18\x01 \x03(\x0c\x12\x10\n\x08last_seq\x18\x02 \x01(\x04\"\x10\n\x0eGetLogsRequest\"\x1f\n\x0fGetLogsResponse\x12\x0c\n\x04logs\x18\x01 \x03(\x0c\"=\n\x14WaitForTracesRequest\x12\r\n\x05\x63ount\x18\x01 \x01(\x04\x12\x16\n\x0etimeout_millis\x18\x02 \x01(\r\"&\n\x15WaitForTracesResponse\x12\r\n\x05\x63ount\x18\x01 \x01(\x04\">\n\x15WaitForMetricsRequest\x12\r\n\x05\x63ount\x18\x01 \x01(\x04\x12\x16\n\x0etimeout_millis\x18\x02 \x01(\r\"\'\n\x16WaitForMetricsResponse\x12\r\n\x05\x63ount\x18\x01 \x01(\x04\x32\xed\x02\n\x14MockCollectorService\x12(\n\x05\x63lear\x12\r.ClearRequest\x1a\x0e.ClearResponse\"\x00\x12\x35\n\nget_traces\x12\x11.GetTracesRequest\x1a\x12.GetTracesResponse\"\x00\x12\x38\n\x0bget_metrics\x12\x12.GetMetricsRequest\x1a\x13.GetMetricsResponse\"\x00\x12/\n\x08get_logs\x12\x0f.GetLogsRequest\x1a\x10.GetLogsResponse\"\x00\x12\x42\n\x0fwait_for_traces\x12\x15.WaitForTracesRequest\x1a\x16.WaitForTracesResponse\"\x00\x12\x45\n\x10wait_for_metrics\x12\x16.WaitForMetricsRequest\x1a\x17.WaitForMetricsResponse\"\x00\x62\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
@@ -36,17 +36,25 @@ if not _descriptor._USE_C_DESCRIPTORS:
   _globals['_CLEARRESPONSE']._serialized_start=48
   _globals['_CLEARRESPONSE']._serialized_end=63
   _globals['_GETTRACESREQUEST']._serialized_start=65
-  _globals['_GETTRACESREQUEST']._serialized_end=83
-  _globals['_GETTRACESRESPONSE']._serialized_start=85
-  _globals['_GETTRACESRESPONSE']._serialized_end=120
-  _globals['_GETMETRICSREQUEST']._serialized_start=122
-  _globals['_GETMETRICSREQUEST']._serialized_end=141
-  _globals['_GETMETRICSRESPONSE']._serialized_start=143
-  _globals['_GETMETRICSRESPONSE']._serialized_end=180
-  _globals['_GETLOGSREQUEST']._serialized_start=182
-  _globals['_GETLOGSREQUEST']._serialized_end=198
-  _globals['_GETLOGSRESPONSE']._serialized_start=200
-  _globals['_GETLOGSRESPONSE']._serialized_end=231
-  _globals['_MOCKCOLLECTORSERVICE']._serialized_start=234
-  _globals['_MOCKCOLLECTORSERVICE']._serialized_end=460
+  _globals['_GETTRACESREQUEST']._serialized_end=102
+  _globals['_GETTRACESRESPONSE']._serialized_start=104
+  _globals['_GETTRACESRESPONSE']._serialized_end=157
+  _globals['_GETMETRICSREQUEST']._serialized_start=159
+  _globals['_GETMETRICSREQUEST']._serialized_end=197
+  _globals['_GETMETRICSRESPONSE']._serialized_start=199
+  _globals['_GETMETRICSRESPONSE']._serialized_end=254
+  _globals['_GETLOGSREQUEST']._serialized_start=256
+  _globals['_GETLOGSREQUEST']._serialized_end=272
+  _globals['_GETLOGSRESPONSE']._serialized_start=274
+  _globals['_GETLOGSRESPONSE']._serialized_end=305
+  _globals['_WAITFORTRACESREQUEST']._serialized_start=307
+  _globals['_WAITFORTRACESREQUEST']._serialized_end=368
+  _globals['_WAITFORTRACESRESPONSE']._serialized_start=370
+  _globals['_WAITFORTRACESRESPONSE']._serialized_end=408
+  _globals['_WAITFORMETRICSREQUEST']._serialized_start=410
+  _globals['_WAITFORMETRICSREQUEST']._serialized_end=472
+  _globals['_WAITFORMETRICSRESPONSE']._serialized_start=474
+  _globals['_WAITFORMETRICSRESPONSE']._serialized_end=513
+  _globals['_MOCKCOLLECTORSERVICE']._serialized_start=516
+  _globals['_MOCKCOLLECTORSERVICE']._serialized_end=881
 # @@protoc_insertion_point(module_scope)
@@ -15,24 +15,32 @@ class ClearResponse(_message.Message):
     def __init__(self) -> None: ...
 
 class GetTracesRequest(_message.Message):
-    __slots__ = ()
-    def __init__(self) -> None: ...
+    __slots__ = ("after_seq",)
+    AFTER_SEQ_FIELD_NUMBER: _ClassVar[int]
+    after_seq: int
+    def __init__(self, after_seq: _Optional[int] = ...) -> None: ...
 
 class GetTracesResponse(_message.Message):
-    __slots__ = ("traces",)
+    __slots__ = ("traces", "last_seq")
     TRACES_FIELD_NUMBER: _ClassVar[int]
+    LAST_SEQ_FIELD_NUMBER: _ClassVar[int]
     traces: _containers.RepeatedScalarFieldContainer[bytes]
-    def __init__(self, traces: _Optional[_Iterable[bytes]] = ...) -> None: ...
+    last_seq: int
+    def __init__(self, traces: _Optional[_Iterable[bytes]] = ..., last_seq: _Optional[int] = ...) -> None: ...
 
 class GetMetricsRequest(_message.Message):
-    __slots__ = ()
-    def __init__(self) -> None: ...
+    __slots__ = ("after_seq",)
+    AFTER_SEQ_FIELD_NUMBER: _ClassVar[int]
+    after_seq: int
+    def __init__(self, after_seq: _Optional[int] = ...) -> None: ...
 
 class GetMetricsResponse(_message.Message):
-    __slots__ = ("metrics",)
+    __slots__ = ("metrics", "last_seq")
     METRICS_FIELD_NUMBER: _ClassVar[int]
+    LAST_SEQ_FIELD_NUMBER: _ClassVar[int]
     metrics: _containers.RepeatedScalarFieldContainer[bytes]
-    def __init__(self, metrics: _Optional[_Iterable[bytes]] = ...) -> None: ...
+    last_seq: int
+    def __init__(self, metrics: _Optional[_Iterable[bytes]] = ..., last_seq: _Optional[int] = ...) -> None: ...
 
 class GetLogsRequest(_message.Message):
     __slots__ = ()
@@ -43,3 +51,31 @@ class GetLogsResponse(_message.Message):
     LOGS_FIELD_NUMBER: _ClassVar[int]
     logs: _containers.RepeatedScalarFieldContainer[bytes]
     def __init__(self, logs: _Optional[_Iterable[bytes]] = ...) -> None: ...
+
+class WaitForTracesRequest(_message.Message):
+    __slots__ = ("count", "timeout_millis")
+    COUNT_FIELD_NUMBER: _ClassVar[int]
+    TIMEOUT_MILLIS_FIELD_NUMBER: _ClassVar[int]
+    count: int
+    timeout_millis: int
+    def __init__(self, count: _Optional[int] = ..., timeout_millis: _Optional[int] = ...) -> None: ...
+
+class WaitForTracesResponse(_message.Message):
+    __slots__ = ("count",)
+    COUNT_FIELD_NUMBER: _ClassVar[int]
+    count: int
+    def __init__(self, count: _Optional[int] = ...) -> None: ...
+
+class WaitForMetricsRequest(_message.Message):
+    __slots__ = ("count", "timeout_millis")
+    COUNT_FIELD_NUMBER: _ClassVar[int]
+    TIMEOUT_MILLIS_FIELD_NUMBER: _ClassVar[int]
+    count: int
+    timeout_millis: int
+    def __init__(self, count: _Optional[int] = ..., timeout_millis: _Optional[int] = ...) -> None: ...
+
+class WaitForMetricsResponse(_message.Message):
+    __slots__ = ("count",)
+    COUNT_FIELD_NUMBER: _ClassVar[int]
+    count: int
+    def __init__(self, count: _Optional[int] = ...) -> None: ...
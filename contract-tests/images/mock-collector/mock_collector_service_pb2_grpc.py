@@ -55,6 +55,16 @@ class MockCollectorServiceStub(object):
                 request_serializer=mock__collector__service__pb2.GetLogsRequest.SerializeToString,
                 response_deserializer=mock__collector__service__pb2.GetLogsResponse.FromString,
                 _registered_method=True)
+        self.wait_for_traces = channel.unary_unary(
+                '/MockCollectorService/wait_for_traces',
+                request_serializer=mock__collector__service__pb2.WaitForTracesRequest.SerializeToString,
+                response_deserializer=mock__collector__service__pb2.WaitForTracesResponse.FromString,
+                _registered_method=True)
+        self.wait_for_metrics = channel.unary_unary(
+                '/MockCollectorService/wait_for_metrics',
+                request_serializer=mock__collector__service__pb2.WaitForMetricsRequest.SerializeToString,
+                response_deserializer=mock__collector__service__pb2.WaitForMetricsResponse.FromString,
+                _registered_method=True)
 
 
 class MockCollectorServiceServicer(object):
@@ -89,6 +99,20 @@ class MockCollectorServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def wait_for_traces(self, request, context):
+        """Blocks until the number of traces in mock collector differs from the given count, or the timeout elapses.
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def wait_for_metrics(self, request, context):
+        """Blocks until the number of metrics in mock collector differs from the given count, or the timeout elapses.
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_MockCollectorServiceServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -112,6 +136,16 @@ def add_MockCollectorServiceServicer_to_server(servicer, server):
                     request_deserializer=mock__collector__service__pb2.GetLogsRequest.FromString,
                     response_serializer=mock__collector__service__pb2.GetLogsResponse.SerializeToString,
             ),
+            'wait_for_traces': grpc.unary_unary_rpc_method_handler(
+                    servicer.wait_for_traces,
+                    request_deserializer=mock__collector__service__pb2.WaitForTracesRequest.FromString,
+                    response_serializer=mock__collector__service__pb2.WaitForTracesResponse.SerializeToString,
+            ),
+            'wait_for_metrics': grpc.unary_unary_rpc_method_handler(
+                    servicer.wait_for_metrics,
+                    request_deserializer=mock__collector__service__pb2.WaitForMetricsRequest.FromString,
+                    response_serializer=mock__collector__service__pb2.WaitForMetricsResponse.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'MockCollectorService', rpc_method_handlers)
@@ -231,3 +265,57 @@ class MockCollectorService(object):
             timeout,
             metadata,
             _registered_method=True)
+
+    @staticmethod
+    def wait_for_traces(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/MockCollectorService/wait_for_traces',
+            mock__collector__service__pb2.WaitForTracesRequest.SerializeToString,
+            mock__collector__service__pb2.WaitForTracesResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def wait_for_metrics(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/MockCollectorService/wait_for_metrics',
+            mock__collector__service__pb2.WaitForMetricsRequest.SerializeToString,
+            mock__collector__service__pb2.WaitForMetricsResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
@@ -1,30 +1,70 @@
 # Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
 # SPDX-License-Identifier: Apache-2.0
-import time
-import re
-from logging import INFO, Logger, getLogger
-from typing import Dict, List
+import os
+from logging import DEBUG, INFO, Logger, getLogger
+from typing import Any, Dict, List, Optional, Tuple
 from unittest import TestCase
 
 from docker import DockerClient
 from docker.models.networks import Network, NetworkCollection
 from docker.types import EndpointConfig
+from google.protobuf.internal import api_implementation
 from mock_collector_client import MockCollectorClient, ResourceScopeMetric, ResourceScopeSpan
-from requests import Response, request
+from requests import Response, Session
 from testcontainers.core.container import DockerContainer
 from testcontainers.core.waiting_utils import wait_for_logs
 from typing_extensions import override
 
-from amazon.utils.application_signals_constants import ERROR_METRIC, FAULT_METRIC, LATENCY_METRIC
+from amazon.utils.application_signals_constants import (
+    APPLICATION_SIGNALS_METRICS,
+    ERROR_METRIC,
+    FAULT_METRIC,
+    LATENCY_METRIC,
+)
 from opentelemetry.proto.common.v1.common_pb2 import AnyValue, KeyValue
+from opentelemetry.proto.trace.v1.trace_pb2 import Span
 
-NETWORK_NAME: str = "aws-application-signals-network"
+# Set by pytest-xdist in every worker process. Each worker starts its own network and containers, so names that are global
+# to the Docker daemon carry the worker id; hostnames inside the network are aliases and stay the same.
+_XDIST_WORKER: str = os.environ.get("PYTEST_XDIST_WORKER", "")
+
+
+def worker_scoped_name(name: str) -> str:
+    """Return a Docker network or container name that is unique to the current pytest-xdist worker."""
+    return f"{name}-{_XDIST_WORKER}" if _XDIST_WORKER else name
+
+
+NETWORK_NAME: str = worker_scoped_name("aws-application-signals-network")
+# wait_for_logs polls every second by default, which adds up to a second to every container start. Each poll reads the
+# container's logs, which stay small until it reports that it is ready.
+WAIT_FOR_LOGS_INTERVAL_SEC: float = 0.1
 
 _logger: Logger = getLogger(__name__)
 _logger.setLevel(INFO)
 _MOCK_COLLECTOR_ALIAS: str = "collector"
-_MOCK_COLLECTOR_NAME: str = "aws-application-signals-mock-collector-nodejs"
+_MOCK_COLLECTOR_IMAGE: str = "aws-application-signals-mock-collector-nodejs"
+_MOCK_COLLECTOR_NAME: str = worker_scoped_name(_MOCK_COLLECTOR_IMAGE)
 _MOCK_COLLECTOR_PORT: int = 4315
+# Upper bound on waiting for the startup metric exports; the tests used to sleep this long unconditionally.
+_STARTUP_METRIC_EXPORTS_TIMEOUT_SEC: float = 3
+# Environment shared by every application container; OTEL_RESOURCE_ATTRIBUTES and the test's extra variables are added
+# on top of it in setUp.
+_APPLICATION_ENVIRONMENT: Dict[str, str] = {
+    "OTEL_METRIC_EXPORT_INTERVAL": "1000",
+    "OTEL_AWS_APPLICATION_SIGNALS_ENABLED": "true",
+    "OTEL_METRICS_EXPORTER": "none",
+    "OTEL_EXPORTER_OTLP_PROTOCOL": "grpc",
+    "OTEL_BSP_SCHEDULE_DELAY": "1",
+    "OTEL_AWS_APPLICATION_SIGNALS_EXPORTER_ENDPOINT": f"http://{_MOCK_COLLECTOR_ALIAS}:{_MOCK_COLLECTOR_PORT}",
+    "OTEL_EXPORTER_OTLP_TRACES_ENDPOINT": f"http://{_MOCK_COLLECTOR_ALIAS}:{_MOCK_COLLECTOR_PORT}",
+    "OTEL_TRACES_SAMPLER": "always_on",
+}
+
+# protobuf silently falls back to its pure-Python runtime when no native backend is available, and every export the
+# tests parse and every attribute they read then goes through interpreted code.
+if api_implementation.Type() == "python":
+    _logger.warning("protobuf is using its pure-Python implementation; parsing collector exports will be slow")
+
 
 def any_value_to_string(any_value_instance):
     field_name = any_value_instance.WhichOneof('value')
@@ -82,6 +122,7 @@ def any_value_to_string(any_value_instance):
         # No field is set or unknown field; cannot convert
         return None
 
+
 # pylint: disable=broad-exception-caught
 class ContractTestBase(TestCase):
     """Base class for implementing a contract test.
@@ -97,23 +138,32 @@ class ContractTestBase(TestCase):
     mock_collector: DockerContainer
     mock_collector_client: MockCollectorClient
     network: Network
+    http_session: Session
+    # Set by tear_down once any test of the class has failed; container output is only read out for failing classes.
+    had_failures: bool = False
 
     @classmethod
     @override
     def setUpClass(cls) -> None:
         cls.addClassCleanup(cls.class_tear_down)
+        cls.had_failures = False
+        cls.http_session = Session()
         cls.network = NetworkCollection(client=DockerClient()).create(NETWORK_NAME)
         mock_collector_networking_config: Dict[str, EndpointConfig] = {
             NETWORK_NAME: EndpointConfig(version="1.22", aliases=[_MOCK_COLLECTOR_ALIAS])
         }
         cls.mock_collector: DockerContainer = (
-            DockerContainer(_MOCK_COLLECTOR_NAME)
+            DockerContainer(_MOCK_COLLECTOR_IMAGE)
             .with_exposed_ports(_MOCK_COLLECTOR_PORT)
             .with_name(_MOCK_COLLECTOR_NAME)
             .with_kwargs(network=NETWORK_NAME, networking_config=mock_collector_networking_config)
         )
         cls.mock_collector.start()
-        wait_for_logs(cls.mock_collector, "Ready", timeout=20)
+        wait_for_logs(cls.mock_collector, "Ready", timeout=20, interval=WAIT_FOR_LOGS_INTERVAL_SEC)
+        # The collector's mapped port does not change while it runs, so it is looked up in Docker once per class.
+        cls.mock_collector_client = MockCollectorClient(
+            cls.mock_collector.get_container_host_ip(), cls.mock_collector.get_exposed_port(_MOCK_COLLECTOR_PORT)
+        )
         cls.set_up_dependency_container()
 
     @classmethod
@@ -124,14 +174,17 @@ class ContractTestBase(TestCase):
             _logger.exception("Failed to tear down dependency container")
 
         try:
-            _logger.info("MockCollector stdout")
-            _logger.info(cls.mock_collector.get_logs()[0].decode())
-            _logger.info("MockCollector stderr")
-            _logger.info(cls.mock_collector.get_logs()[1].decode())
+            if cls.should_log_container_output():
+                stdout, stderr = cls.mock_collector.get_logs()
+                _logger.info("MockCollector stdout")
+                _logger.info(stdout.decode())
+                _logger.info("MockCollector stderr")
+                _logger.info(stderr.decode())
             cls.mock_collector.stop()
         except Exception:
             _logger.exception("Failed to tear down mock collector")
 
+        cls.http_session.close()
         cls.network.remove()
 
     @override
@@ -143,38 +196,63 @@ class ContractTestBase(TestCase):
         self.application: DockerContainer = (
             DockerContainer(self.get_application_image_name())
             .with_exposed_ports(self.get_application_port())
-            .with_env("OTEL_METRIC_EXPORT_INTERVAL", "1000")
-            .with_env("OTEL_AWS_APPLICATION_SIGNALS_ENABLED", "true")
-            .with_env("OTEL_METRICS_EXPORTER", "none")
-            .with_env("OTEL_EXPORTER_OTLP_PROTOCOL", "grpc")
-            .with_env("OTEL_BSP_SCHEDULE_DELAY", "1")
-            .with_env("OTEL_AWS_APPLICATION_SIGNALS_EXPORTER_ENDPOINT", f"http://collector:{_MOCK_COLLECTOR_PORT}")
-            .with_env("OTEL_EXPORTER_OTLP_TRACES_ENDPOINT", f"http://collector:{_MOCK_COLLECTOR_PORT}")
-            .with_env("OTEL_RESOURCE_ATTRIBUTES", self.get_application_otel_resource_attributes())
-            .with_env("OTEL_TRACES_SAMPLER", "always_on")
             .with_kwargs(network=NETWORK_NAME, networking_config=application_networking_config)
-            .with_name(self.get_application_image_name())
+            .with_name(worker_scoped_name(self.get_application_image_name()))
         )
-
-        extra_env: Dict[str, str] = self.get_application_extra_environment_variables()
-        for key in extra_env:
-            self.application.with_env(key, extra_env.get(key))
+        # testcontainers passes env to Docker as the container's environment; with_kwargs(environment=...) would clash
+        # with it, so the variables are merged into it directly.
+        self.application.env.update(_APPLICATION_ENVIRONMENT)
+        self.application.env["OTEL_RESOURCE_ATTRIBUTES"] = self.get_application_otel_resource_attributes()
+        self.application.env.update(self.get_application_extra_environment_variables())
         self.application.start()
-        wait_for_logs(self.application, self.get_application_wait_pattern(), timeout=20)
-        self.mock_collector_client: MockCollectorClient = MockCollectorClient(
-            self.mock_collector.get_container_host_ip(), self.mock_collector.get_exposed_port(_MOCK_COLLECTOR_PORT)
+        wait_for_logs(
+            self.application, self.get_application_wait_pattern(), timeout=20, interval=WAIT_FOR_LOGS_INTERVAL_SEC
+        )
+        # Both lookups are Docker API calls, so they are made once per container rather than once per request.
+        self._application_url: str = (
+            f"http://{self.application.get_container_host_ip()}:"
+            f"{self.application.get_exposed_port(self.get_application_port())}/"
         )
-        # Sleep for 3s to ensure any startup metrics have been exported
-        time.sleep(3)
+        # Startup telemetry has to reach the collector before it is cleared. Spans are exported within milliseconds, but
+        # metrics only on each export interval, and an export already on its way when the application became ready may
+        # not include everything recorded before then. The second export to arrive after this clear does.
+        self.mock_collector_client.clear_signals()
+        self.mock_collector_client.wait_for_metric_exports(2, _STARTUP_METRIC_EXPORTS_TIMEOUT_SEC)
         # Clear all start up metrics, so tests are only testing telemetry generated by their invocations.
         self.mock_collector_client.clear_signals()
 
+    @classmethod
+    def should_log_container_output(cls) -> bool:
+        """Whether container output is worth reading: it is only needed to investigate a failure."""
+        return cls.had_failures or _logger.isEnabledFor(DEBUG)
+
+    def _test_failed(self) -> bool:
+        """Whether the running test has raised an error or failure, as seen from its cleanups."""
+        outcome: Any = self._outcome
+        if outcome is None:
+            return False
+        errors: Optional[List[Tuple[TestCase, Any]]] = getattr(outcome, "errors", None)
+        if errors is not None:
+            # Up to Python 3.10, errors and failures stay on the outcome until the cleanups have run.
+            return any(exc_info is not None for _, exc_info in errors)
+        # From Python 3.11 they are reported to the result straight away. A result that does not keep them, such as
+        # pytest's, cannot tell, so the test is treated as failed and its output logged as it always used to be.
+        result: Any = outcome.result
+        if not hasattr(result, "errors") or not hasattr(result, "failures"):
+            return True
+        return any(test is self for test, _ in result.errors + result.failures)
+
     def tear_down(self) -> None:
+        test_failed: bool = self._test_failed()
+        if test_failed:
+            type(self).had_failures = True
         try:
-            _logger.info("Application stdout")
-            _logger.info(self.application.get_logs()[0].decode())
-            _logger.info("Application stderr")
-            _logger.info(self.application.get_logs()[1].decode())
+            if test_failed or _logger.isEnabledFor(DEBUG):
+                stdout, stderr = self.application.get_logs()
+                _logger.info("Application stdout")
+                _logger.info(stdout.decode())
+                _logger.info("Application stderr")
+                _logger.info(stderr.decode())
             self.application.stop()
         except Exception:
             _logger.exception("Failed to tear down application")
@@ -191,51 +269,57 @@ class ContractTestBase(TestCase):
         self._assert_aws_span_attributes(resource_scope_spans, path, **kwargs)
         self._assert_semantic_conventions_span_attributes(resource_scope_spans, method, path, status_code, **kwargs)
 
-        metrics: List[ResourceScopeMetric] = self.mock_collector_client.get_metrics(
-            {LATENCY_METRIC, ERROR_METRIC, FAULT_METRIC}
-        )
+        metrics: List[ResourceScopeMetric] = self.mock_collector_client.get_metrics(APPLICATION_SIGNALS_METRICS)
         self._assert_metric_attributes(metrics, LATENCY_METRIC, 5000, **kwargs)
         self._assert_metric_attributes(metrics, ERROR_METRIC, expected_error, **kwargs)
         self._assert_metric_attributes(metrics, FAULT_METRIC, expected_fault, **kwargs)
 
     def send_request(self, method, path) -> Response:
-        address: str = self.application.get_container_host_ip()
-        port: str = self.application.get_exposed_port(self.get_application_port())
-        url: str = f"http://{address}:{port}/{path}"
+        url: str = self._application_url + path
         _logger.info("send request to url: " + url)
-        return request(method, url, timeout=20)
+        return self.http_session.request(method, url, timeout=20)
+
+    def _get_client_spans(self, resource_scope_spans: List[ResourceScopeSpan]) -> List[Span]:
+        """Return the client spans of resource_scope_spans."""
+        span_kind_client: int = Span.SPAN_KIND_CLIENT  # pylint: disable=no-member
+        return [
+            resource_scope_span.span
+            for resource_scope_span in resource_scope_spans
+            if resource_scope_span.span.kind == span_kind_client
+        ]
 
     def _get_attributes_dict(self, attributes_list: List[KeyValue]) -> Dict[str, AnyValue]:
-        # _logger.info("Get the attributes dictionary ==============")
-        attributes_dict: Dict[str, AnyValue] = {}
-        for attribute in attributes_list:
-            key: str = attribute.key
-            value: AnyValue = attribute.value
-            # _logger.info("key: " + key + " value: " + any_value_to_string(value))
-
-            if key in attributes_dict:
-                old_value: AnyValue = attributes_dict[key]
-                self.fail(f"Attribute {key} unexpectedly duplicated. Value 1: {old_value} Value 2: {value}")
-            attributes_dict[key] = value
+        attributes_dict: Dict[str, AnyValue] = {attribute.key: attribute.value for attribute in attributes_list}
+        if len(attributes_dict) != len(attributes_list):
+            # A key collapsed into an earlier one; walk the list again only to report the first duplicate.
+            seen: Dict[str, AnyValue] = {}
+            for attribute in attributes_list:
+                if attribute.key in seen:
+                    self.fail(
+                        f"Attribute {attribute.key} unexpectedly duplicated. "
+                        f"Value 1: {seen[attribute.key]} Value 2: {attribute.value}"
+                    )
+                seen[attribute.key] = attribute.value
         return attributes_dict
 
     def _assert_str_attribute(self, attributes_dict: Dict[str, AnyValue], key: str, expected_value: str):
-        self.assertIn(key, attributes_dict)
-        actual_value: AnyValue = attributes_dict[key]
-        self.assertIsNotNone(actual_value)
-        self.assertEqual(expected_value, actual_value.string_value)
+        self._assert_attribute_value(attributes_dict, key, "string_value", expected_value)
 
     def _assert_int_attribute(self, attributes_dict: Dict[str, AnyValue], key: str, expected_value: int) -> None:
-        self.assertIn(key, attributes_dict)
-        actual_value: AnyValue = attributes_dict[key]
-        self.assertIsNotNone(actual_value)
-        self.assertEqual(expected_value, actual_value.int_value)
-              
+        self._assert_attribute_value(attributes_dict, key, "int_value", expected_value)
+
     def _assert_float_attribute(self, attributes_dict: Dict[str, AnyValue], key: str, expected_value: float) -> None:
-        self.assertIn(key, attributes_dict)
-        actual_value: AnyValue = attributes_dict[key]
-        self.assertIsNotNone(actual_value)
-        self.assertEqual(expected_value, actual_value.double_value)
+        self._assert_attribute_value(attributes_dict, key, "double_value", expected_value)
+
+    def _assert_attribute_value(
+        self, attributes_dict: Dict[str, AnyValue], key: str, value_field: str, expected_value: Any
+    ) -> None:
+        # Runs for every expected attribute; assertIn is only called to report a missing key. Stored values are never
+        # None, so a present key needs no further check before comparing.
+        actual_value: Optional[AnyValue] = attributes_dict.get(key)
+        if actual_value is None:
+            self.assertIn(key, attributes_dict)
+        self.assertEqual(expected_value, getattr(actual_value, value_field))
 
     def check_sum(self, metric_name: str, actual_sum: float, expected_sum: float) -> None:
         if metric_name is LATENCY_METRIC:
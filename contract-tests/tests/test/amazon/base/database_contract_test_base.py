@@ -1,11 +1,12 @@
 # Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
 # SPDX-License-Identifier: Apache-2.0
-from typing import Dict, List
+from typing import Dict, List, Optional
 
+from docker.types import EndpointConfig
 from mock_collector_client import ResourceScopeMetric, ResourceScopeSpan
 from typing_extensions import override
 
-from amazon.base.contract_test_base import ContractTestBase
+from amazon.base.contract_test_base import NETWORK_NAME, ContractTestBase, worker_scoped_name
 from amazon.utils.application_signals_constants import (
     AWS_LOCAL_OPERATION,
     AWS_LOCAL_SERVICE,
@@ -25,6 +26,12 @@ DATABASE_HOST: str = "mydb"
 DATABASE_NAME: str = "testdb"
 DATABASE_PASSWORD: str = "example"
 DATABASE_USER: str = "root"
+# The database container's name is global to the Docker daemon, so it carries the xdist worker id; the application
+# reaches it through DATABASE_HOST, which is an alias on the worker's network.
+DATABASE_CONTAINER_NAME: str = worker_scoped_name(DATABASE_HOST)
+DATABASE_NETWORKING_CONFIG: Dict[str, EndpointConfig] = {
+    NETWORK_NAME: EndpointConfig(version="1.22", aliases=[DATABASE_HOST])
+}
 SPAN_KIND_CLIENT: str = "CLIENT"
 SPAN_KIND_LOCAL_ROOT: str = "LOCAL_ROOT"
 
@@ -90,11 +97,7 @@ class DatabaseContractTestBase(ContractTestBase):
 
     @override
     def _assert_aws_span_attributes(self, resource_scope_spans: List[ResourceScopeSpan], path: str, **kwargs) -> None:
-        target_spans: List[Span] = []
-        for resource_scope_span in resource_scope_spans:
-            # pylint: disable=no-member
-            if resource_scope_span.span.kind == Span.SPAN_KIND_CLIENT:
-                target_spans.append(resource_scope_span.span)
+        target_spans: List[Span] = self._get_client_spans(resource_scope_spans)
 
         self.assertEqual(
             len(target_spans), 1, f"target_spans is {str(target_spans)}, although only one walue was expected"
@@ -105,11 +108,7 @@ class DatabaseContractTestBase(ContractTestBase):
     def _assert_semantic_conventions_span_attributes(
         self, resource_scope_spans: List[ResourceScopeSpan], method: str, path: str, status_code: int, **kwargs
     ) -> None:
-        target_spans: List[Span] = []
-        for resource_scope_span in resource_scope_spans:
-            # pylint: disable=no-member
-            if resource_scope_span.span.kind == Span.SPAN_KIND_CLIENT:
-                target_spans.append(resource_scope_span.span)
+        target_spans: List[Span] = self._get_client_spans(resource_scope_spans)
 
         self.assertEqual(target_spans[0].name, kwargs.get("span_name"))
         if status_code == 200:
@@ -127,9 +126,9 @@ class DatabaseContractTestBase(ContractTestBase):
         self._assert_str_attribute(attributes_dict, "db.name", DATABASE_NAME)
         self._assert_str_attribute(attributes_dict, "net.peer.name", DATABASE_HOST)
         self._assert_int_attribute(attributes_dict, "net.peer.port", self.get_database_port())
-        self.assertTrue("server.address" not in attributes_dict)
-        self.assertTrue("server.port" not in attributes_dict)
-        self.assertTrue("db.operation" not in attributes_dict)
+        self.assertNotIn("server.address", attributes_dict)
+        self.assertNotIn("server.port", attributes_dict)
+        self.assertNotIn("db.operation", attributes_dict)
 
     @override
     def _assert_aws_attributes(
@@ -151,10 +150,12 @@ class DatabaseContractTestBase(ContractTestBase):
     def _assert_metric_attributes(
         self, resource_scope_metrics: List[ResourceScopeMetric], metric_name: str, expected_sum: int, **kwargs
     ) -> None:
-        target_metrics: List[Metric] = []
-        for resource_scope_metric in resource_scope_metrics:
-            if resource_scope_metric.metric.name.lower() == metric_name.lower():
-                target_metrics.append(resource_scope_metric.metric)
+        metric_name_lower: str = metric_name.lower()
+        target_metrics: List[Metric] = [
+            resource_scope_metric.metric
+            for resource_scope_metric in resource_scope_metrics
+            if resource_scope_metric.metric.name.lower() == metric_name_lower
+        ]
         self.assertLessEqual(
             len(target_metrics),
             2,
@@ -164,11 +165,12 @@ class DatabaseContractTestBase(ContractTestBase):
             dp for target_metric in target_metrics for dp in target_metric.exponential_histogram.data_points
         ]
         self.assertEqual(len(dp_list), 2)
-        dependency_dp: ExponentialHistogramDataPoint = dp_list[0]
-        service_dp: ExponentialHistogramDataPoint = dp_list[1]
-        if len(dp_list[1].attributes) > len(dp_list[0].attributes):
-            dependency_dp = dp_list[1]
-            service_dp = dp_list[0]
+        # One data point is the CLIENT dependency, the other the request's LOCAL_ROOT one; tell them apart by span kind.
+        first_span_kind: Optional[AnyValue] = self._get_attributes_dict(dp_list[0].attributes).get(AWS_SPAN_KIND)
+        if first_span_kind is not None and first_span_kind.string_value == SPAN_KIND_CLIENT:
+            dependency_dp, service_dp = dp_list
+        else:
+            service_dp, dependency_dp = dp_list
         self._assert_aws_attributes(dependency_dp.attributes, SPAN_KIND_CLIENT, **kwargs)
         self.check_sum(metric_name, dependency_dp.sum, expected_sum)
 
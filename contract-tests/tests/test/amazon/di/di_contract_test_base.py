@@ -27,12 +27,15 @@ from testcontainers.core.container import DockerContainer
 from testcontainers.core.waiting_utils import wait_for_logs
 from typing_extensions import override
 
+from amazon.base.contract_test_base import WAIT_FOR_LOGS_INTERVAL_SEC, worker_scoped_name
+
 _logger: Logger = getLogger(__name__)
 _logger.setLevel(INFO)
 
-NETWORK_NAME: str = "aws-application-signals-network"
+NETWORK_NAME: str = worker_scoped_name("aws-application-signals-network")
 _MOCK_COLLECTOR_ALIAS: str = "collector"
-_MOCK_COLLECTOR_NAME: str = "aws-application-signals-mock-collector-nodejs"
+_MOCK_COLLECTOR_IMAGE: str = "aws-application-signals-mock-collector-nodejs"
+_MOCK_COLLECTOR_NAME: str = worker_scoped_name(_MOCK_COLLECTOR_IMAGE)
 _MOCK_COLLECTOR_GRPC_PORT: int = 4315
 _MOCK_COLLECTOR_HTTP_PORT: int = 4318
 
@@ -101,19 +104,25 @@ class DITestInfrastructure(TestCase):
             NETWORK_NAME: EndpointConfig(version="1.22", aliases=[_MOCK_COLLECTOR_ALIAS])
         }
         cls.mock_collector = (
-            DockerContainer(_MOCK_COLLECTOR_NAME)
+            DockerContainer(_MOCK_COLLECTOR_IMAGE)
             .with_exposed_ports(_MOCK_COLLECTOR_GRPC_PORT, _MOCK_COLLECTOR_HTTP_PORT)
             .with_name(_MOCK_COLLECTOR_NAME)
             .with_kwargs(network=NETWORK_NAME, networking_config=mock_collector_networking_config)
         )
         cls.mock_collector.start()
-        wait_for_logs(cls.mock_collector, "Ready", timeout=20)
+        wait_for_logs(cls.mock_collector, "Ready", timeout=20, interval=WAIT_FOR_LOGS_INTERVAL_SEC)
+        # The collector's mapped port does not change while it runs, so it is looked up in Docker once per class.
+        cls.mock_collector_client = MockCollectorClient(
+            cls.mock_collector.get_container_host_ip(),
+            cls.mock_collector.get_exposed_port(_MOCK_COLLECTOR_GRPC_PORT),
+        )
 
     @classmethod
     def class_tear_down(cls) -> None:
         try:
-            _logger.info("MockCollector stdout:\n%s", cls.mock_collector.get_logs()[0].decode())
-            _logger.info("MockCollector stderr:\n%s", cls.mock_collector.get_logs()[1].decode())
+            stdout, stderr = cls.mock_collector.get_logs()
+            _logger.info("MockCollector stdout:\n%s", stdout.decode())
+            _logger.info("MockCollector stderr:\n%s", stderr.decode())
             cls.mock_collector.stop()
         except Exception:
             _logger.exception("Failed to tear down mock collector")
@@ -154,7 +163,7 @@ class DITestInfrastructure(TestCase):
             .with_env("OTEL_AWS_DYNAMIC_INSTRUMENTATION_PROBE_POLL_INTERVAL", DI_POLL_INTERVAL)
             .with_env("OTEL_LOG_LEVEL", "debug")
             .with_kwargs(network=NETWORK_NAME, networking_config=app_networking_config)
-            .with_name(self.get_application_image_name())
+            .with_name(worker_scoped_name(self.get_application_image_name()))
         )
 
         for key, val in self.get_application_extra_environment_variables().items():
@@ -165,10 +174,12 @@ class DITestInfrastructure(TestCase):
             self.application,
             self.get_application_wait_pattern(),
             timeout=self.get_application_start_timeout(),
+            interval=WAIT_FOR_LOGS_INTERVAL_SEC,
         )
-        self.mock_collector_client = MockCollectorClient(
-            self.mock_collector.get_container_host_ip(),
-            self.mock_collector.get_exposed_port(_MOCK_COLLECTOR_GRPC_PORT),
+        # Both lookups are Docker API calls, so they are made once per container rather than once per request.
+        self._application_url: str = (
+            f"http://{self.application.get_container_host_ip()}:"
+            f"{self.application.get_exposed_port(self.get_application_port())}/"
         )
         # Wait for DI pollers to fetch configs and instrument functions
         time.sleep(int(DI_POLL_INTERVAL) + 10)
@@ -177,8 +188,9 @@ class DITestInfrastructure(TestCase):
 
     def tear_down(self) -> None:
         try:
-            _logger.info("Application stdout:\n%s", self.application.get_logs()[0].decode())
-            _logger.info("Application stderr:\n%s", self.application.get_logs()[1].decode())
+            stdout, stderr = self.application.get_logs()
+            _logger.info("Application stdout:\n%s", stdout.decode())
+            _logger.info("Application stderr:\n%s", stderr.decode())
             self.application.stop()
         except Exception:
             _logger.exception("Failed to tear down application")
@@ -266,9 +278,7 @@ class DITestInfrastructure(TestCase):
     # -------------------------------------------------------------------------
 
     def send_request(self, method: str, path: str, **kwargs) -> Response:
-        address: str = self.application.get_container_host_ip()
-        port: str = self.application.get_exposed_port(self.get_application_port())
-        url: str = f"http://{address}:{port}/{path}"
+        url: str = self._application_url + path
         return request(method, url, timeout=20, **kwargs)
 
     # -------------------------------------------------------------------------
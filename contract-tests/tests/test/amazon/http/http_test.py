@@ -64,11 +64,7 @@ class HttpTest(ContractTestBase):
 
     @override
     def _assert_aws_span_attributes(self, resource_scope_spans: List[ResourceScopeSpan], path: str, **kwargs) -> None:
-        target_spans: List[Span] = []
-        for resource_scope_span in resource_scope_spans:
-            # pylint: disable=no-member
-            if resource_scope_span.span.kind == Span.SPAN_KIND_CLIENT:
-                target_spans.append(resource_scope_span.span)
+        target_spans: List[Span] = self._get_client_spans(resource_scope_spans)
 
         self.assertEqual(len(target_spans), 1)
         # _logger.info(target_spans[0].attributes)
@@ -86,11 +82,7 @@ class HttpTest(ContractTestBase):
     def _assert_semantic_conventions_span_attributes(
         self, resource_scope_spans: List[ResourceScopeSpan], method: str, path: str, status_code: int, **kwargs
     ) -> None:
-        target_spans: List[Span] = []
-        for resource_scope_span in resource_scope_spans:
-            # pylint: disable=no-member
-            if resource_scope_span.span.kind == Span.SPAN_KIND_CLIENT:
-                target_spans.append(resource_scope_span.span)
+        target_spans: List[Span] = self._get_client_spans(resource_scope_spans)
 
         self.assertEqual(len(target_spans), 1)
         self.assertEqual(target_spans[0].name, method)
@@ -116,10 +108,12 @@ class HttpTest(ContractTestBase):
         expected_sum: int,
         **kwargs,
     ) -> None:
-        target_metrics: List[Metric] = []
-        for resource_scope_metric in resource_scope_metrics:
-            if resource_scope_metric.metric.name.lower() == metric_name.lower():
-                target_metrics.append(resource_scope_metric.metric)
+        metric_name_lower: str = metric_name.lower()
+        target_metrics: List[Metric] = [
+            resource_scope_metric.metric
+            for resource_scope_metric in resource_scope_metrics
+            if resource_scope_metric.metric.name.lower() == metric_name_lower
+        ]
 
         self.assertEqual(len(target_metrics), 1)
         target_metric: Metric = target_metrics[0]
@@ -128,11 +122,11 @@ class HttpTest(ContractTestBase):
 
         self.assertEqual(len(dp_list), 3)
 
-        # Find the data point with the longest attributes list and assign it to service_dp
-        dependency_dp: ExponentialHistogramDataPoint = max(dp_list, key=lambda dp: len(dp.attributes))
-        # Assign the remaining two elements to dependency_dp and other_dp
-        remaining_dps = [dp for dp in dp_list if dp != dependency_dp]
-        service_dp, other_dp = remaining_dps[0], remaining_dps[1]
+        # The data point with the longest attributes list is the dependency one; the other two are LOCAL_ROOT. They are
+        # told apart by position, as comparing data points with != would compare every attribute, bucket and exemplar.
+        dependency_index: int = max(range(len(dp_list)), key=lambda index: len(dp_list[index].attributes))
+        dependency_dp: ExponentialHistogramDataPoint = dp_list[dependency_index]
+        service_dp, other_dp = [dp for index, dp in enumerate(dp_list) if index != dependency_index]
 
         attribute_dict: Dict[str, AnyValue] = self._get_attributes_dict(dependency_dp.attributes)
         method: str = kwargs.get("request_method")
@@ -1,14 +1,14 @@
 # Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
 # SPDX-License-Identifier: Apache-2.0
 import time
-from typing import Dict, List
+from typing import List, Set
 
 from mock_collector_client import ResourceScopeMetric, ResourceScopeSpan
-from requests import Response, request
+from requests import Response
 from typing_extensions import override
 
 from amazon.base.contract_test_base import ContractTestBase
-from amazon.utils.application_signals_constants import ERROR_METRIC, FAULT_METRIC, LATENCY_METRIC
+from amazon.utils.application_signals_constants import APPLICATION_SIGNALS_METRICS
 from opentelemetry.sdk.metrics.export import AggregationTemporality
 
 # Tests in this class are supposed to validate that the SDK was configured in the correct way: It
@@ -30,14 +30,9 @@ class ConfigurationTest(ContractTestBase):
         return ["backend"]
 
     def test_configuration_metrics(self):
-        address: str = self.application.get_container_host_ip()
-        port: str = self.application.get_exposed_port(self.get_application_port())
-        url: str = f"http://{address}:{port}/success"
-        response: Response = request("GET", url, timeout=20)
+        response: Response = self.send_request("GET", "success")
         self.assertEqual(200, response.status_code)
-        metrics: List[ResourceScopeMetric] = self.mock_collector_client.get_metrics(
-            {LATENCY_METRIC, ERROR_METRIC, FAULT_METRIC}
-        )
+        metrics: List[ResourceScopeMetric] = self.mock_collector_client.get_metrics(APPLICATION_SIGNALS_METRICS)
 
         self.assertEqual(len(metrics), 3)
         for metric in metrics:
@@ -60,29 +55,29 @@ class ConfigurationTest(ContractTestBase):
         https://github.com/open-telemetry/opentelemetry-python-contrib/blob/main/sdk-extension/opentelemetry-sdk-extension-aws/src/opentelemetry/sdk/extension/aws/trace/aws_xray_id_generator.py
         """
 
-        seen: List[str] = []
-        for _ in range(100):
-            address: str = self.application.get_container_host_ip()
-            port: str = self.application.get_exposed_port(self.get_application_port())
-            url: str = f"http://{address}:{port}/success"
-            response: Response = request("GET", url, timeout=20)
+        # The requests are sent first and their spans read back in one go; each request starts its own trace.
+        request_count: int = 100
+        # Both run on the same host, so the time in epoch registered in each traceid should be approximately equal to
+        # the time in the test while the requests were being made.
+        first_request_time_sec: int = int(time.time())
+        for _ in range(request_count):
+            response: Response = self.send_request("GET", "success")
             self.assertEqual(200, response.status_code)
+        last_request_time_sec: int = int(time.time())
 
-            # Since we just made the request, the time in epoch registered in the traceid should be
-            # approximate equal to the current time in the test, since both run on the same host.
-            start_time_sec: int = int(time.time())
-
-            resource_scope_spans: List[ResourceScopeSpan] = self.mock_collector_client.get_traces()
-            target_span: ResourceScopeSpan = resource_scope_spans[0]
-
-            self.assertTrue(target_span.span.trace_id.hex() not in seen)
-            seen.append(target_span.span.trace_id.hex())
+        # Wait for the server span of every request, not just for the collector to go quiet.
+        resource_scope_spans: List[ResourceScopeSpan] = self.mock_collector_client.get_traces(
+            min_server_spans=request_count
+        )
+        trace_ids: Set[bytes] = {resource_scope_span.span.trace_id for resource_scope_span in resource_scope_spans}
+        # No traceid may repeat across requests.
+        self.assertEqual(len(trace_ids), request_count)
 
-            # trace_id is bytes, so we convert it to hex string and pick the first 8 byte
-            # that represent the timestamp, then convert it to int for timestamp in second
-            trace_id_time_stamp_int: int = int(target_span.span.trace_id.hex()[:8], 16)
+        for trace_id in trace_ids:
+            # The first 4 bytes of the traceid represent the timestamp in seconds
+            trace_id_time_stamp_int: int = int.from_bytes(trace_id[:4], "big")
 
             # Give 2 minutes time range of tolerance for the trace timestamp
-            self.assertGreater(trace_id_time_stamp_int, start_time_sec - 60)
-            self.assertGreater(start_time_sec + 60, trace_id_time_stamp_int)
-            self.mock_collector_client.clear_signals()
+            self.assertGreater(trace_id_time_stamp_int, first_request_time_sec - 60)
+            self.assertGreater(last_request_time_sec + 60, trace_id_time_stamp_int)
+        self.mock_collector_client.clear_signals()
@@ -1,24 +1,30 @@
 # Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
 # SPDX-License-Identifier: Apache-2.0
-from typing import Dict, List
+from types import MappingProxyType
+from typing import Dict, FrozenSet, List, Mapping
 
 from mock_collector_client import ResourceScopeMetric, ResourceScopeSpan
-from requests import Response, request
+from requests import Response
 from typing_extensions import override
 
 from amazon.base.contract_test_base import ContractTestBase
-from amazon.utils.application_signals_constants import ERROR_METRIC, FAULT_METRIC, LATENCY_METRIC
+from amazon.utils.application_signals_constants import APPLICATION_SIGNALS_METRICS
 from opentelemetry.proto.common.v1.common_pb2 import AnyValue
-from opentelemetry.proto.metrics.v1.metrics_pb2 import Metric
-from opentelemetry.proto.trace.v1.trace_pb2 import Span
+from opentelemetry.proto.metrics.v1.metrics_pb2 import ResourceMetrics
+from opentelemetry.proto.trace.v1.trace_pb2 import ResourceSpans, Span
 
 
-def _get_k8s_attributes():
-    return {
+_K8S_ATTRIBUTES: Mapping[str, str] = MappingProxyType(
+    {
         "k8s.namespace.name": "namespace-name",
         "k8s.pod.name": "pod-name",
         "k8s.deployment.name": "deployment-name",
     }
+)
+# Names the Application Signals metrics are exported with.
+_RESOURCE_METRIC_NAMES: FrozenSet[str] = frozenset(("Error", "Fault", "Latency"))
+# _K8S_ATTRIBUTES in the key=value,... form of OTEL_RESOURCE_ATTRIBUTES.
+_K8S_RESOURCE_ATTRIBUTES: str = ",".join(f"{key}={value}" for key, value in _K8S_ATTRIBUTES.items())
 
 
 # Tests consuming this class are supposed to validate that the agent is able to get the resource
@@ -43,37 +49,34 @@ class ResourceAttributesTest(ContractTestBase):
         return ["backend"]
 
     def do_test_resource_attributes(self, service_name):
-        address: str = self.application.get_container_host_ip()
-        port: str = self.application.get_exposed_port(self.get_application_port())
-        url: str = f"http://{address}:{port}/success"
-        response: Response = request("GET", url, timeout=20)
+        response: Response = self.send_request("GET", "success")
         self.assertEqual(200, response.status_code)
         self.assert_resource_attributes(service_name)
 
     def assert_resource_attributes(self, service_name):
         resource_scope_spans: List[ResourceScopeSpan] = self.mock_collector_client.get_traces()
-        metrics: List[ResourceScopeMetric] = self.mock_collector_client.get_metrics(
-            {LATENCY_METRIC, ERROR_METRIC, FAULT_METRIC}
-        )
-        target_spans: List[Span] = []
-        for resource_scope_span in resource_scope_spans:
+        metrics: List[ResourceScopeMetric] = self.mock_collector_client.get_metrics(APPLICATION_SIGNALS_METRICS)
+        target_spans: List[ResourceSpans] = [
+            resource_scope_span.resource_spans
+            for resource_scope_span in resource_scope_spans
             # pylint: disable=no-member
-            if resource_scope_span.span.name == "GET" and resource_scope_span.span.kind == Span.SPAN_KIND_CLIENT:
-                target_spans.append(resource_scope_span.resource_spans)
+            if resource_scope_span.span.name == "GET" and resource_scope_span.span.kind == Span.SPAN_KIND_CLIENT
+        ]
 
         self.assertEqual(len(target_spans), 1)
         attributes_dict: Dict[str, AnyValue] = self._get_attributes_dict(target_spans[0].resource.attributes)
-        for key, value in _get_k8s_attributes().items():
+        for key, value in _K8S_ATTRIBUTES.items():
             self._assert_str_attribute(attributes_dict, key, value)
         self._assert_str_attribute(attributes_dict, "service.name", service_name)
 
-        target_metrics: List[Metric] = []
-        for resource_scope_metric in metrics:
-            if resource_scope_metric.metric.name in ["Error", "Fault", "Latency"]:
-                target_metrics.append(resource_scope_metric.resource_metrics)
+        target_metrics: List[ResourceMetrics] = [
+            resource_scope_metric.resource_metrics
+            for resource_scope_metric in metrics
+            if resource_scope_metric.metric.name in _RESOURCE_METRIC_NAMES
+        ]
         self.assertEqual(len(target_metrics), 3)
         for target_metric in target_metrics:
             metric_attributes_dict: Dict[str, AnyValue] = self._get_attributes_dict(target_metric.resource.attributes)
-            for key, value in _get_k8s_attributes().items():
+            for key, value in _K8S_ATTRIBUTES.items():
                 self._assert_str_attribute(metric_attributes_dict, key, value)
             self._assert_str_attribute(metric_attributes_dict, "service.name", service_name)
@@ -1,8 +1,6 @@
 # Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
 # SPDX-License-Identifier: Apache-2.0
-from typing import List
-
-from resource_attributes_test_base import ResourceAttributesTest, _get_k8s_attributes
+from resource_attributes_test_base import _K8S_RESOURCE_ATTRIBUTES, ResourceAttributesTest
 from typing_extensions import override
 
 
@@ -10,10 +8,7 @@ class UnknownServiceNameTest(ResourceAttributesTest):
     @override
     # pylint: disable=no-self-use
     def get_application_otel_resource_attributes(self) -> str:
-        pairlist: List[str] = []
-        for key, value in _get_k8s_attributes().items():
-            pairlist.append(key + "=" + value)
-        return ",".join(pairlist)
+        return _K8S_RESOURCE_ATTRIBUTES
 
     def test_service(self) -> None:
         # See https://github.com/aws-observability/aws-otel-js-instrumentation/blob/cec7306366a29ebb87cd303cb820abfe50cd5e30/aws-distro-opentelemetry-node-autoinstrumentation/src/aws-metric-attribute-generator.ts#L62-L66
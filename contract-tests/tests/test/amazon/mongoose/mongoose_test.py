@@ -9,7 +9,8 @@ from typing_extensions import override
 
 from amazon.base.contract_test_base import NETWORK_NAME
 from amazon.base.database_contract_test_base import (
-    DATABASE_HOST,
+    DATABASE_CONTAINER_NAME,
+    DATABASE_NETWORKING_CONFIG,
     DATABASE_PASSWORD,
     DATABASE_USER,
     SPAN_KIND_CLIENT,
@@ -35,8 +36,8 @@ class MongooseTest(DatabaseContractTestBase):
             DockerContainer("mongo:7.0.9")
             .with_env("MONGO_INITDB_ROOT_USERNAME", DATABASE_USER)
             .with_env("MONGO_INITDB_ROOT_PASSWORD", DATABASE_PASSWORD)
-            .with_kwargs(network=NETWORK_NAME)
-            .with_name(DATABASE_HOST)
+            .with_kwargs(network=NETWORK_NAME, networking_config=DATABASE_NETWORKING_CONFIG)
+            .with_name(DATABASE_CONTAINER_NAME)
         )
         cls.container.start()
 
@@ -97,7 +98,7 @@ class MongooseTest(DatabaseContractTestBase):
         self._assert_str_attribute(attributes_dict, "net.peer.name", "mydb")
         self._assert_int_attribute(attributes_dict, "net.peer.port", self.get_database_port())
         self._assert_str_attribute(attributes_dict, "db.operation", kwargs.get("db_operation"))
-        self.assertTrue("db.statement" not in attributes_dict)
-        self.assertTrue("db.user" not in attributes_dict)
-        self.assertTrue("server.address" not in attributes_dict)
-        self.assertTrue("server.port" not in attributes_dict)
+        self.assertNotIn("db.statement", attributes_dict)
+        self.assertNotIn("db.user", attributes_dict)
+        self.assertNotIn("server.address", attributes_dict)
+        self.assertNotIn("server.port", attributes_dict)
@@ -1,14 +1,13 @@
 # Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
 # SPDX-License-Identifier: Apache-2.0
-from typing import Dict, List
-
 from testcontainers.mysql import MySqlContainer
 from typing_extensions import override
 
 from amazon.base.contract_test_base import NETWORK_NAME
 from amazon.base.database_contract_test_base import (
-    DATABASE_HOST,
+    DATABASE_CONTAINER_NAME,
     DATABASE_NAME,
+    DATABASE_NETWORKING_CONFIG,
     DATABASE_PASSWORD,
     DATABASE_USER,
     DatabaseContractTestBase,
@@ -21,8 +20,8 @@ class Mysql2Test(DatabaseContractTestBase):
     def set_up_dependency_container(cls) -> None:
         cls.container = (
             MySqlContainer(MYSQL_USER=DATABASE_USER, MYSQL_PASSWORD=DATABASE_PASSWORD, MYSQL_DATABASE=DATABASE_NAME)
-            .with_kwargs(network=NETWORK_NAME)
-            .with_name(DATABASE_HOST)
+            .with_kwargs(network=NETWORK_NAME, networking_config=DATABASE_NETWORKING_CONFIG)
+            .with_name(DATABASE_CONTAINER_NAME)
         )
         cls.container.start()
 
@@ -3,11 +3,14 @@
 """
 Constants for attributes and metric names defined in Application Signals.
 """
+from typing import FrozenSet
 
 # Metric names
 LATENCY_METRIC: str = "latency"
 ERROR_METRIC: str = "error"
 FAULT_METRIC: str = "fault"
+# The metrics every Application Signals request produces, as passed to MockCollectorClient.get_metrics.
+APPLICATION_SIGNALS_METRICS: FrozenSet[str] = frozenset((LATENCY_METRIC, ERROR_METRIC, FAULT_METRIC))
 
 # Attribute names
 AWS_LOCAL_SERVICE: str = "aws.local.service"
@@ -19,6 +22,6 @@ AWS_REMOTE_RESOURCE_TYPE: str = "aws.remote.resource.type"
 AWS_REMOTE_RESOURCE_IDENTIFIER: str = "aws.remote.resource.identifier"
 AWS_CLOUDFORMATION_PRIMARY_IDENTIFIER: str = 'aws.remote.resource.cfn.primary.identifier'
 AWS_SPAN_KIND: str = "aws.span.kind"
-AWS_REMOTE_RESOURCE_ACCOUNT_ACCESS_KEY: str =  "aws.remote.resource.account.access_key"
+AWS_REMOTE_RESOURCE_ACCOUNT_ACCESS_KEY: str = "aws.remote.resource.account.access_key"
 AWS_REMOTE_RESOURCE_ACCOUNT_ID: str = "aws.remote.resource.account.id"
 AWS_REMOTE_RESOURCE_REGION: str = "aws.remote.resource.region"
\ No newline at end of file
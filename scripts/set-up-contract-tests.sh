@@ -23,6 +23,7 @@ rm -rf dist/contract_tests*
 
 # Install python dependency for contract-test
 python3 -m pip install pytest
+python3 -m pip install pytest-xdist
 python3 -m pip install pymysql
 python3 -m pip install cryptography
 python3 -m pip install mysql-connector-python
@@ -33,6 +34,17 @@ python3 -m pip install pymongo
 # since Otel-Instrumentation running in container that install psycopg2 from source
 python3 -m pip install sqlalchemy psycopg2-binary
 
+# Pull third-party images used by the tests now, so the registry fetch is not part of a test class's setup.
+# The LocalStack image is read from _LOCAL_STACK_IMAGE in the AWS SDK test, so the two cannot disagree.
+if [ -z "$TARGET_APP" ] || [ "$TARGET_APP" = "aws-sdk" ]; then
+  local_stack_image=`sed -n 's/^_LOCAL_STACK_IMAGE: str = "\(.*\)"$/\1/p' contract-tests/tests/test/amazon/aws-sdk/aws_sdk_test.py`
+  if [ -z "$local_stack_image" ]; then
+    echo "Could not read _LOCAL_STACK_IMAGE from aws_sdk_test.py"
+    exit 1
+  fi
+  docker pull "$local_stack_image"
+fi
+
 # Create mock-collector image
 cd contract-tests/images/mock-collector
 docker build . -t aws-application-signals-mock-collector-nodejs